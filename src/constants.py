@@ -4,3 +4,6 @@ MESSAGE_BASE_PATH = Path('/tmp')
 REQUEST_PATH = MESSAGE_BASE_PATH / 'request'
 RESPONSE_PATH = MESSAGE_BASE_PATH / 'response'
 CONFIRM_PATH = MESSAGE_BASE_PATH / 'confirm'
+
+# Seconds between checks while waiting for a game server to become ready
+READY_POLL_INTERVAL = 0.1
@@ -1,17 +1,21 @@
+import time
+
+# Taken before any other work so the startup timings cover imports too
+BOOT_TIME = time.perf_counter()
+
 import os
 import re
 import logging
 import pathlib
 
 import sys
-import time
 from pathlib import Path
 from typing import Union
 
 sys.path.append(".")
 
 from src.server_monitor import GameMonitor, EC2ServerMonitor
-from src.utils import tmux_sendkeys, json_from_file
+from src.utils import tmux_sendkeys, json_from_file, wait_for_log_line, PhaseTimer
 
 
 class FactorioMonitor(GameMonitor):
@@ -27,6 +31,9 @@ class FactorioMonitor(GameMonitor):
         save_file = self.config['save_file']
         factorio_exe = self.config['factorio_exe']
         start_server_cmd = f"{factorio_exe} --start-server {save_file}"
+        # Remove the previous run's log so its ready line isn't mistaken for this one
+        if os.path.exists(self.tmux_log):
+            os.remove(self.tmux_log)
         os.system(f'tmux new-session -s {self.tmux_session_name} -d')
         tmux_sendkeys(self.tmux_session_name, f"{start_server_cmd} 2>&1 | tee {self.tmux_log}")
 
@@ -74,11 +81,21 @@ class FactorioMonitor(GameMonitor):
         val = os.popen(f'lsof -i:{self.port}').read()
         return bool(val)
 
+    def wait_until_ready(self, timeout) -> bool:
+        # Factorio listens on UDP, so use its own log line for when the game is hosted
+        return wait_for_log_line(self.tmux_log, r"changing state from\(CreatingGame\) to\(InGame\)", timeout)
+
 
 if __name__ == '__main__':
+    startup_timer = PhaseTimer(BOOT_TIME)
+    startup_timer.mark("imports")
     debug = True
     factorio_config = Path("Configs/Games/factorio_config.json")
     factorio_monitor = FactorioMonitor(factorio_config, debug)
+    # Launch the game first, the rest of the setup happens while it boots
+    factorio_monitor.start_game_server()
+    startup_timer.mark("game_launched")
     config_path = Path("Configs/EC2_Monitor_Config.json").absolute()
-    ec2_monitor = EC2ServerMonitor(factorio_monitor, config_path)
-    ec2_monitor.run()
+    ec2_monitor = EC2ServerMonitor(factorio_monitor, config_path, startup_timer)
+    startup_timer.mark("monitor_setup")
+    ec2_monitor.run(game_launched=True)
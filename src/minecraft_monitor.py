@@ -1,3 +1,8 @@
+import time
+
+# Taken before any other work so the startup timings cover imports too
+BOOT_TIME = time.perf_counter()
+
 import os
 import logging
 import pathlib
@@ -9,7 +14,7 @@ from typing import Union
 sys.path.append(".")
 
 from src.server_monitor import GameMonitor, EC2ServerMonitor
-from src.utils import tmux_sendkeys, create_tmux_session, json_from_file
+from src.utils import tmux_sendkeys, create_tmux_session, json_from_file, wait_for_port, PhaseTimer
 
 
 class MinecraftMonitor(GameMonitor):
@@ -72,11 +77,21 @@ class MinecraftMonitor(GameMonitor):
         val = os.popen(f'lsof -iTCP:{self.port} -sTCP:LISTEN').read()
         return bool(val)
 
+    def wait_until_ready(self, timeout) -> bool:
+        # Minecraft is ready for players once it accepts TCP connections
+        return wait_for_port(self.port, timeout)
+
 
 if __name__ == '__main__':
+    startup_timer = PhaseTimer(BOOT_TIME)
+    startup_timer.mark("imports")
     debug = False
     minecraft_config = Path("Configs/Games/minecraft.json")
     minecraft_monitor = MinecraftMonitor(minecraft_config, debug)
+    # Launch the game first, the rest of the setup happens while it boots
+    minecraft_monitor.start_game_server()
+    startup_timer.mark("game_launched")
     config_path = Path("Configs/EC2_Monitor_Config.json").absolute()
-    ec2_monitor = EC2ServerMonitor(minecraft_monitor, config_path)
-    ec2_monitor.run()
+    ec2_monitor = EC2ServerMonitor(minecraft_monitor, config_path, startup_timer)
+    startup_timer.mark("monitor_setup")
+    ec2_monitor.run(game_launched=True)
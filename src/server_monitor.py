@@ -6,10 +6,10 @@ import os
 import time
 from pathlib import Path
 
-from typing import Type, Union
+from typing import Optional, Type, Union
 
-from src.constants import REQUEST_PATH, RESPONSE_PATH, CONFIRM_PATH
-from src.utils import get_now_str, Timer, json_from_file, json_to_file
+from src.constants import REQUEST_PATH, RESPONSE_PATH, CONFIRM_PATH, READY_POLL_INTERVAL
+from src.utils import get_now_str, Timer, PhaseTimer, json_from_file, json_to_file
 
 
 class GameMonitor(ABC):
@@ -38,10 +38,24 @@ class GameMonitor(ABC):
     def server_running(self):
         raise NotImplementedError
 
+    def wait_until_ready(self, timeout) -> bool:
+        """
+        Blocks until the game server is ready for players, returning False if it isn't within 'timeout' seconds.
+        Subclasses should override this with a notification the game provides (log line, open port).
+        """
+        timer = Timer(timeout)
+        timer.start()
+        while not timer.expired:
+            if self.server_running:
+                return True
+            time.sleep(READY_POLL_INTERVAL)
+        return self.server_running
+
 
 class EC2ServerMonitor:
 
-    def __init__(self, game_monitor: GameMonitor, config_file: Union[str, Path]):
+    def __init__(self, game_monitor: GameMonitor, config_file: Union[str, Path],
+                 startup_timer: Optional[PhaseTimer] = None):
         self.config = json_from_file(config_file)
 
         self.logger = logging.getLogger("EC2Monitor")
@@ -56,9 +70,11 @@ class EC2ServerMonitor:
         self.down_timer = Timer(self.config["max_downtime"])
 
         self.game_monitor = game_monitor
+        self.startup_timer = startup_timer if startup_timer is not None else PhaseTimer()
 
-    def run(self):
-        self.start_game_server()
+    def run(self, game_launched: bool = False):
+        # The entry points may launch the game before setting up the monitor to save boot time
+        self.start_game_server(launch=not game_launched)
 
         # Don't start if game server failed to start.
         if self.should_shutdown:
@@ -100,23 +116,23 @@ class EC2ServerMonitor:
             logging.shutdown()
             os.system("shutdown -h 1")
 
-    def start_game_server(self):
+    def start_game_server(self, launch: bool = True):
         # Start game server
-        self.logger.debug(f"Attempting to start game server. {get_now_str()}")
-        self.game_monitor.start_game_server()
+        if launch:
+            self.logger.debug(f"Attempting to start game server. {get_now_str()}")
+            self.game_monitor.start_game_server()
+            self.startup_timer.mark("game_launched")
 
-        # Wait for game server to start
-        self.down_timer.start()
-        while not self.game_monitor.server_running:
+        # Wait for game server to report that it is ready
+        if not self.game_monitor.wait_until_ready(self.config["max_downtime"]):
             # Shut off EC2 instance if server doesn't start.
-            if self.down_timer.expired:
-                self.should_shutdown = True
-                self.shutdown_ec2_instance("Game server failed to start.")
-
-            time.sleep(self.config["heartbeat"])
+            self.should_shutdown = True
+            self.shutdown_ec2_instance("Game server failed to start.")
+            return
 
-        self.down_timer.reset()
+        self.startup_timer.mark("game_ready")
         self.logger.debug(f"Game server started. {get_now_str()}")
+        self.logger.debug(f"Startup timings: {self.startup_timer}")
 
     def check_for_crashed_server(self):
         # If server isn't running
@@ -0,0 +1,160 @@
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+
+sys.path.append(".")
+
+from src.server_monitor import GameMonitor, EC2ServerMonitor
+from src.utils import PhaseTimer, json_to_file, wait_for_log_line, wait_for_port
+
+# Pretends to be a game server: boots for a while, opens its port, then logs that it is ready.
+FAKE_SERVER_SCRIPT = """
+import socket, sys, time
+port, log_file, boot_time = int(sys.argv[1]), sys.argv[2], float(sys.argv[3])
+time.sleep(boot_time)
+listener = socket.socket()
+listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+listener.bind(('127.0.0.1', port))
+ready_at = time.time()
+listener.listen()
+with open(log_file, 'a') as log:
+    log.write(f'Done! ready_at={ready_at}\\n')
+time.sleep(3600)
+"""
+READY_PATTERN = r"Done! ready_at="
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class FakeGameMonitor(GameMonitor):
+
+    def __init__(self, log_file: Path, boot_time: float, readiness: str, heartbeat: float):
+        super().__init__(debug_mode=True)
+        self.log_file = log_file
+        self.boot_time = boot_time
+        self.readiness = readiness
+        self.heartbeat = heartbeat
+        self.port = get_free_port()
+        self.process = None
+
+    def parse_command(self, command: str):
+        return command
+
+    def start_game_server(self):
+        if self.log_file.exists():
+            os.remove(self.log_file)
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", FAKE_SERVER_SCRIPT, str(self.port), str(self.log_file), str(self.boot_time)]
+        )
+
+    def shutdown_game_server(self):
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+
+    @property
+    def server_empty(self):
+        return True
+
+    @property
+    def server_running(self):
+        with socket.socket() as sock:
+            return sock.connect_ex(('127.0.0.1', self.port)) == 0
+
+    def wait_until_ready(self, timeout) -> bool:
+        if self.readiness == "port":
+            return wait_for_port(self.port, timeout)
+        if self.readiness == "log":
+            return wait_for_log_line(self.log_file, READY_PATTERN, timeout)
+        # Previous behaviour: poll server_running once per heartbeat
+        while not self.server_running:
+            time.sleep(self.heartbeat)
+        return True
+
+    @property
+    def ready_at(self) -> float:
+        # The port opens just before the line is written, so make sure it's there
+        wait_for_log_line(self.log_file, READY_PATTERN, 5)
+        line = self.log_file.read_text().strip().splitlines()[-1]
+        return float(line.split("ready_at=")[1])
+
+
+def measure_import_time(module: str, runs: int):
+    # Each run uses a fresh interpreter so nothing is already cached in sys.modules
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+        samples.append(float(output.stdout))
+    return samples
+
+
+def measure_time_to_ready(work_dir: Path, readiness: str, boot_time: float, heartbeat: float, runs: int):
+    config_file = work_dir / "monitor_config.json"
+    json_to_file({
+        "heartbeat": heartbeat,
+        "max_empty_time": 60,
+        "max_downtime": boot_time + 10 * heartbeat,
+        "shutdown_wait_time": 10,
+        "loggingLevel": "DEBUG",
+        "log_file": str(work_dir / "monitor.log"),
+        "command_timeout": 1,
+    }, config_file)
+
+    ready_times = []
+    detection_delays = []
+    for _ in range(runs):
+        game_monitor = FakeGameMonitor(work_dir / "game.log", boot_time, readiness, heartbeat)
+        startup_timer = PhaseTimer()
+        ec2_monitor = EC2ServerMonitor(game_monitor, config_file, startup_timer)
+        try:
+            ec2_monitor.start_game_server()
+            detected_time = time.time()
+            ready_times.append(startup_timer.phases["game_ready"])
+            detection_delays.append(detected_time - game_monitor.ready_at)
+        finally:
+            game_monitor.shutdown_game_server()
+        # Release the handler added by the monitor so log files don't pile up
+        for handler in list(ec2_monitor.logger.handlers):
+            ec2_monitor.logger.removeHandler(handler)
+            handler.close()
+    return ready_times, detection_delays
+
+
+def summarize(samples):
+    return f"median={statistics.median(samples) * 1000:.1f}ms max={max(samples) * 1000:.1f}ms"
+
+
+@click.command()
+@click.option('--runs', default=5, help='Number of runs per measurement.')
+@click.option('--boot-time', default=1.0, help='Seconds the fake game server takes to start.')
+@click.option('--heartbeat', default=1.0, help='Heartbeat used by the polling baseline.')
+def main(runs: int, boot_time: float, heartbeat: float):
+    for module in ("src.minecraft_monitor", "src.factorio_monitor"):
+        click.echo(f"import {module}: {summarize(measure_import_time(module, runs))}")
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for readiness in ("heartbeat", "port", "log"):
+            ready_times, detection_delays = measure_time_to_ready(
+                Path(work_dir), readiness, boot_time, heartbeat, runs
+            )
+            click.echo(
+                f"time-to-ready ({readiness}): {summarize(ready_times)}, "
+                f"detection delay: {summarize(detection_delays)}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,11 @@
 import json
 import os
+import re
+import socket
 import time
 from datetime import datetime
-from dateutil import tz
+
+from src.constants import READY_POLL_INTERVAL
 
 
 def create_tmux_session(session_name: str):
@@ -49,7 +52,70 @@ class Timer:
         self.start_time = None
 
 
+class PhaseTimer:
+    """
+    Records how long after 'start_time' each named phase was reached.
+    """
+    def __init__(self, start_time=None):
+        self.start_time = time.perf_counter() if start_time is None else start_time
+        self.phases = {}
+
+    def mark(self, phase: str):
+        self.phases[phase] = time.perf_counter() - self.start_time
+        return self.phases[phase]
+
+    def __str__(self):
+        return ", ".join(f"{phase}={elapsed:.3f}s" for phase, elapsed in self.phases.items())
+
+
+def wait_for_port(port: int, timeout, host='127.0.0.1', poll_interval=READY_POLL_INTERVAL):
+    """
+    Returns True as soon as a TCP listener accepts connections on 'port', False on timeout.
+    """
+    timer = Timer(timeout)
+    timer.start()
+    while not timer.expired:
+        try:
+            with socket.create_connection((host, port), timeout=poll_interval):
+                return True
+        except OSError:
+            time.sleep(poll_interval)
+    return False
+
+
+def wait_for_log_line(file_path, pattern: str, timeout, poll_interval=READY_POLL_INTERVAL):
+    """
+    Follows the log at 'file_path' and returns True as soon as a line matches 'pattern',
+    False on timeout. The file does not need to exist yet.
+    """
+    regex = re.compile(pattern)
+    offset = 0
+    partial_line = ''
+    timer = Timer(timeout)
+    timer.start()
+    while not timer.expired:
+        if os.path.exists(file_path):
+            # Start over if the log was truncated or rotated
+            if os.path.getsize(file_path) < offset:
+                offset = 0
+                partial_line = ''
+            with open(file_path, 'rb') as file:
+                file.seek(offset)
+                chunk = file.read()
+                offset = file.tell()
+            text = partial_line + chunk.decode(errors='replace')
+            if regex.search(text):
+                return True
+            # Keep the unfinished last line so a match split across reads isn't missed
+            partial_line = text[text.rfind('\n') + 1:]
+        time.sleep(poll_interval)
+    return False
+
+
 def get_now_str():
+    # Imported here so the monitor entry points don't pay for it before launching the game
+    from dateutil import tz
+
     from_zone = tz.gettz("UTC")
     to_zone = tz.gettz("America/Los_Angeles")
     now_utc = datetime.utcnow().replace(tzinfo=from_zone)